@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+TrendMonster Strategy - Kernel Build Script
+===========================================
+
+Ahead-of-time compiles the numeric signal kernels from trendmonster_signal
+into a native extension module (_tm_kernel), so deployments can ship
+compiled kernels without numba or JIT warmup at runtime.
+trendmonster_signal imports the extension automatically when it is present
+and uses it for float64 generate_batch() calls.
+
+The strategy thresholds and weights are compiled in. Re-run this script
+after changing StrategyParams or the allocation table; a stale build is
+detected at import and ignored.
+
+Requires numba (build time only) and numpy.
+
+Usage:
+    python compile_kernel.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+import trendmonster_signal as tm
+
+
+def build(output_dir: str = os.path.dirname(os.path.abspath(__file__))) -> None:
+    """
+    Compile _tm_kernel next to trendmonster_signal.py.
+    
+    Args:
+        output_dir: Directory to write the extension module to
+    """
+    cc = CC("_tm_kernel")
+    cc.output_dir = output_dir
+    
+    # (uptrend, vix_ratio, vix_level, spy, tqqq, cash) over float64 arrays
+    cc.export(
+        "signal_batch",
+        "Tuple((b1[:], f8[:], i8[:], f8[:], f8[:], f8[:]))(f8[:], f8[:], f8[:], f8[:])"
+    )(tm._signal_batch)
+    cc.export("kernel_params", "UniTuple(f8, %d)()" % len(tm._KERNEL_PARAMS))(
+        _kernel_params
+    )
+    
+    cc.compile()
+
+
+def _kernel_params():
+    return tm._KERNEL_PARAMS
+
+
+if __name__ == "__main__":
+    build()
+    print("Built _tm_kernel in", os.path.dirname(os.path.abspath(__file__)))
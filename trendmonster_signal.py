@@ -33,14 +33,39 @@ SIGNAL TIMING
 - Daily signals: Evaluated after market close, executed next day open
 - No intraday signal changes
 
+BATCH BACKTESTS
+---------------
+generate_batch() evaluates whole arrays of bars at once with NumPy
+(optional dependency - only required for the batch path). MarketDataFrame
+holds a series of MarketData bars as columns for that path. If numba is
+installed the batch kernel is JIT-compiled on first use (cached on disk);
+it is never imported by the scalar signal path. Running
+compile_kernel.py builds them ahead of time (_tm_kernel extension); the
+batch path prefers that build for float64 inputs, skipping JIT warmup.
+
 Author: TrendMonster Strategy
 Version: 2.1
 """
 
-from dataclasses import dataclass
+import asyncio
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Tuple, Optional
-from datetime import datetime
+from math import inf, isfinite, nextafter
+from typing import AsyncIterable, Callable, Dict, Iterable, List, Tuple, Optional
+from datetime import datetime, timezone
+import json
+import warnings
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for generate_batch()
+    np = None
+
+try:
+    import orjson
+except ImportError:  # Signal.to_json_bytes() falls back to the json module
+    orjson = None
 
 
 # ============================================================================
@@ -63,6 +88,14 @@ class StrategyParams:
     # Above VIX_ELEVATED: Very defensive
 
 
+# Module-level copies of the thresholds used by the hot signal functions
+# (avoids a global + class attribute lookup per comparison)
+_VIX_VERY_LOW = StrategyParams.VIX_VERY_LOW
+_VIX_LOW = StrategyParams.VIX_LOW
+_VIX_MODERATE = StrategyParams.VIX_MODERATE
+_VIX_ELEVATED = StrategyParams.VIX_ELEVATED
+
+
 # ============================================================================
 # ENUMS & DATA CLASSES
 # ============================================================================
@@ -90,9 +123,28 @@ class VIXLevel(Enum):
     HIGH = "HIGH"              # > 1.05
 
 
-@dataclass
+# Enum members used on the hot path. Members are singletons, so they are
+# compared with "is"; reading them from a module global is much cheaper
+# than attribute access through the Enum class.
+_UPTREND = Trend.UPTREND
+_DOWNTREND = Trend.DOWNTREND
+_POSTURE_CASH = Posture.CASH
+
+
+# Display templates (%-formatting with constant strings)
+_ALLOC_FMT = "SPY: %.0f%% | TQQQ: %.0f%% | Cash: %.0f%%"
+_TRADE_FMT = "%s %.1f%% %s"
+_MOVE_TO_CASH_FMT = "Move %.1f%% to Cash"
+_DEPLOY_CASH_FMT = "Deploy %.1f%% from Cash"
+
+
+@dataclass(frozen=True, slots=True)
 class Allocation:
-    """Target portfolio allocation."""
+    """
+    Target portfolio allocation.
+    
+    Immutable, so the canonical strategy allocations below can be shared.
+    """
     spy_weight: float      # SPY allocation (0.0 to 1.0)
     tqqq_weight: float     # TQQQ allocation (0.0 to 1.0)
     cash_weight: float     # Cash allocation (0.0 to 1.0)
@@ -112,11 +164,19 @@ class Allocation:
         )
     
     def __str__(self) -> str:
-        spy, tqqq, cash = self.as_percentages()
-        return f"SPY: {spy:.0f}% | TQQQ: {tqqq:.0f}% | Cash: {cash:.0f}%"
+        return _ALLOC_FMT % self.as_percentages()
+
 
+# Canonical allocations, built once at import and returned by calculate_allocation()
+_ALLOC_CASH = Allocation(spy_weight=0.0, tqqq_weight=0.0, cash_weight=1.0)
+_ALLOC_VERY_LOW = Allocation(spy_weight=0.30, tqqq_weight=0.70, cash_weight=0.0)
+_ALLOC_LOW = Allocation(spy_weight=0.50, tqqq_weight=0.50, cash_weight=0.0)
+_ALLOC_MODERATE = Allocation(spy_weight=0.60, tqqq_weight=0.40, cash_weight=0.0)
+_ALLOC_ELEVATED = Allocation(spy_weight=0.75, tqqq_weight=0.25, cash_weight=0.0)
+_ALLOC_HIGH = Allocation(spy_weight=0.85, tqqq_weight=0.15, cash_weight=0.0)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MarketData:
     """
     Required market data inputs.
@@ -124,6 +184,8 @@ class MarketData:
     All values should be from CONFIRMED closes only:
     - Weekly data: Previous Friday's close
     - Daily data: Previous day's close
+    
+    Frozen; vix_ratio is derived at construction - use dataclasses.replace().
     """
     # Weekly data (from last Friday's close)
     spy_weekly_close: float
@@ -137,15 +199,61 @@ class MarketData:
     weekly_as_of: Optional[datetime] = None  # Date of weekly close
     daily_as_of: Optional[datetime] = None   # Date of daily close
     
-    @property
-    def vix_ratio(self) -> float:
+    # Derived: VIX/VIX3M ratio
+    vix_ratio: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
         """Calculate VIX/VIX3M ratio."""
         if self.vix3m_close == 0:
             raise ValueError("VIX3M cannot be zero")
-        return self.vix_close / self.vix3m_close
+        object.__setattr__(
+            self, "vix_ratio", float(self.vix_close) / float(self.vix3m_close)
+        )
+
+
+# One-entry isoformat() caches, one per Signal timestamp field. Each holds a
+# single (datetime, str) tuple so updates are atomic across threads.
+_GENERATED_ISO = [(None, None)]
+_WEEKLY_ISO = [(None, None)]
+_DAILY_ISO = [(None, None)]
+
+
+def _isoformat(dt: Optional[datetime], cache: list) -> Optional[str]:
+    """
+    dt.isoformat(), reusing the cached string when dt is the same object.
+    
+    Repeated to_dict() calls on one signal, and signals built from the same
+    MarketData dates, then skip the string formatting.
+    """
+    if dt is None:
+        return None
+    entry = cache[0]
+    if entry[0] is not dt:
+        entry = (dt, dt.isoformat())
+        cache[0] = entry
+    return entry[1]
 
 
-@dataclass
+def _json_timestamp(dt: Optional[datetime], cache: list) -> str:
+    """Cached isoformat() as a JSON string literal, or null."""
+    if dt is None:
+        return "null"
+    return '"%s"' % _isoformat(dt, cache)
+
+
+# Signal.to_json() template: compact to_dict() layout. Enum values are
+# fixed identifiers and numbers use str() (== repr() for float), so only
+# rebalance_instructions needs escaping.
+_SIGNAL_JSON_FMT = (
+    '{"trend":"%s","posture":"%s","vix_level":"%s",'
+    '"allocation":{"spy":%s,"tqqq":%s,"cash":%s},'
+    '"indicators":{"vix_ratio":%s,"spy_close":%s,"spy_sma":%s},'
+    '"rebalance_required":%s,"rebalance_instructions":%s,'
+    '"timestamps":{"signal_generated":%s,"weekly_data_as_of":%s,"daily_data_as_of":%s}}'
+)
+
+
+@dataclass(slots=True)
 class Signal:
     """
     Complete strategy signal output.
@@ -194,17 +302,157 @@ class Signal:
             "rebalance_required": self.rebalance_required,
             "rebalance_instructions": self.rebalance_instructions,
             "timestamps": {
-                "signal_generated": self.signal_generated_at.isoformat(),
-                "weekly_data_as_of": self.weekly_data_as_of.isoformat() if self.weekly_data_as_of else None,
-                "daily_data_as_of": self.daily_data_as_of.isoformat() if self.daily_data_as_of else None
+                "signal_generated": _isoformat(self.signal_generated_at, _GENERATED_ISO),
+                "weekly_data_as_of": _isoformat(self.weekly_data_as_of, _WEEKLY_ISO),
+                "daily_data_as_of": _isoformat(self.daily_data_as_of, _DAILY_ISO)
             }
         }
+    
+    def _all_finite(self) -> bool:
+        """True if every number written by the serializers is finite."""
+        allocation = self.allocation
+        # nan/inf propagate through the sum (an overflow just takes the
+        # equally correct slow path)
+        return isfinite(allocation.spy_weight + allocation.tqqq_weight
+                        + allocation.cash_weight + self.vix_ratio
+                        + self.spy_close + self.spy_sma)
+    
+    def to_json(self) -> str:
+        """
+        Serialize signal to compact JSON (same document as to_dict()).
+        
+        Fills a fixed template directly instead of building the nested dict;
+        only rebalance_instructions goes through json.dumps() for escaping.
+        Non-finite numbers fall back to json.dumps(), which writes them as
+        NaN/Infinity rather than str()'s nan/inf.
+        """
+        if not self._all_finite():
+            return json.dumps(self.to_dict(), separators=(",", ":"))
+        
+        spy_pct, tqqq_pct, cash_pct = self.allocation.as_percentages()
+        return _SIGNAL_JSON_FMT % (
+            self.trend.value,
+            self.posture.value,
+            self.vix_level.value,
+            spy_pct,
+            tqqq_pct,
+            cash_pct,
+            round(self.vix_ratio, 4),
+            round(self.spy_close, 2),
+            round(self.spy_sma, 2),
+            "true" if self.rebalance_required else "false",
+            json.dumps(self.rebalance_instructions),
+            _json_timestamp(self.signal_generated_at, _GENERATED_ISO),
+            _json_timestamp(self.weekly_data_as_of, _WEEKLY_ISO),
+            _json_timestamp(self.daily_data_as_of, _DAILY_ISO)
+        )
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize signal to compact UTF-8 JSON (same document as to_dict()).
+        
+        Uses orjson when installed. Timestamps go through the same cached
+        isoformat() strings as to_dict(), since orjson rejects datetime
+        subclasses (e.g. pandas.Timestamp) and truncates UTC offsets with
+        seconds.
+        """
+        if orjson is None:
+            return self.to_json().encode()
+        
+        # orjson writes NaN/Infinity as null; keep them as to_dict() would
+        if not self._all_finite():
+            return self.to_json().encode()
+        
+        spy_pct, tqqq_pct, cash_pct = self.allocation.as_percentages()
+        return orjson.dumps({
+            "trend": self.trend.value,
+            "posture": self.posture.value,
+            "vix_level": self.vix_level.value,
+            "allocation": {
+                "spy": spy_pct,
+                "tqqq": tqqq_pct,
+                "cash": cash_pct
+            },
+            "indicators": {
+                "vix_ratio": round(self.vix_ratio, 4),
+                "spy_close": round(self.spy_close, 2),
+                "spy_sma": round(self.spy_sma, 2)
+            },
+            "rebalance_required": self.rebalance_required,
+            "rebalance_instructions": self.rebalance_instructions,
+            "timestamps": {
+                "signal_generated": _isoformat(self.signal_generated_at, _GENERATED_ISO),
+                "weekly_data_as_of": _isoformat(self.weekly_data_as_of, _WEEKLY_ISO),
+                "daily_data_as_of": _isoformat(self.daily_data_as_of, _DAILY_ISO)
+            }
+        }, option=orjson.OPT_SERIALIZE_NUMPY)  # closes may be numpy scalars
 
 
 # ============================================================================
 # CORE SIGNAL LOGIC
 # ============================================================================
 
+# VIX ratio bucket tables. bisect_right() returns the number of thresholds
+# <= ratio, which matches the "ratio < threshold" bucket boundaries.
+_VIX_THRESHOLDS = (_VIX_VERY_LOW, _VIX_LOW, _VIX_MODERATE, _VIX_ELEVATED)
+_VIX_LEVELS = (
+    VIXLevel.VERY_LOW,
+    VIXLevel.LOW,
+    VIXLevel.MODERATE,
+    VIXLevel.ELEVATED,
+    VIXLevel.HIGH,
+)
+_UPTREND_ALLOCS = (
+    _ALLOC_VERY_LOW,
+    _ALLOC_LOW,
+    _ALLOC_MODERATE,
+    _ALLOC_ELEVATED,
+    _ALLOC_HIGH,
+)
+
+# Posture is DEFENSIVE only when ratio is strictly above VIX_ELEVATED, so the
+# upper boundary is nudged to the next float to keep ratio == VIX_ELEVATED
+# BALANCED under bisect_right.
+_POSTURE_THRESHOLDS = (_VIX_LOW, nextafter(_VIX_ELEVATED, inf))
+_UPTREND_POSTURES = (
+    Posture.AGGRESSIVE,
+    Posture.BALANCED,
+    Posture.DEFENSIVE,
+)
+# A NaN ratio fails both "< VIX_LOW" and "> VIX_ELEVATED", so it is BALANCED;
+# bisect_right() would place it past the end (DEFENSIVE)
+_POSTURE_NAN = Posture.BALANCED
+
+# Weight columns of _UPTREND_ALLOCS, for the numeric batch kernels
+_UPTREND_SPY_WTS = tuple(a.spy_weight for a in _UPTREND_ALLOCS)
+_UPTREND_TQQQ_WTS = tuple(a.tqqq_weight for a in _UPTREND_ALLOCS)
+_UPTREND_CASH_WTS = tuple(a.cash_weight for a in _UPTREND_ALLOCS)
+
+# (spy, tqqq, cash) -> shared Allocation, for interning current allocations
+_CANONICAL_ALLOCS = {
+    (a.spy_weight, a.tqqq_weight, a.cash_weight): a
+    for a in (_ALLOC_CASH,) + _UPTREND_ALLOCS
+}
+
+
+# Parameters baked into the ahead-of-time build (see compile_kernel.py)
+_KERNEL_PARAMS = _VIX_THRESHOLDS + _UPTREND_SPY_WTS + _UPTREND_TQQQ_WTS + _UPTREND_CASH_WTS
+
+# AOT-compiled extension, if built: compiled batch kernel without JIT
+# warmup. A build made with different parameters is ignored.
+try:
+    import _tm_kernel
+except ImportError:
+    _tm_kernel = None
+else:
+    if _tm_kernel.kernel_params() != _KERNEL_PARAMS:
+        warnings.warn(
+            "_tm_kernel was built with different strategy parameters; "
+            "rebuild it with compile_kernel.py"
+        )
+        _tm_kernel = None
+
+
 def determine_trend(spy_close: float, spy_sma: float) -> Trend:
     """
     Determine market trend based on weekly close vs 50-week SMA.
@@ -216,7 +464,7 @@ def determine_trend(spy_close: float, spy_sma: float) -> Trend:
     Returns:
         Trend.UPTREND if price > SMA, else Trend.DOWNTREND
     """
-    return Trend.UPTREND if spy_close > spy_sma else Trend.DOWNTREND
+    return _UPTREND if spy_close > spy_sma else _DOWNTREND
 
 
 def classify_vix_level(vix_ratio: float) -> VIXLevel:
@@ -229,16 +477,7 @@ def classify_vix_level(vix_ratio: float) -> VIXLevel:
     Returns:
         VIXLevel enum value
     """
-    if vix_ratio < StrategyParams.VIX_VERY_LOW:
-        return VIXLevel.VERY_LOW
-    elif vix_ratio < StrategyParams.VIX_LOW:
-        return VIXLevel.LOW
-    elif vix_ratio < StrategyParams.VIX_MODERATE:
-        return VIXLevel.MODERATE
-    elif vix_ratio < StrategyParams.VIX_ELEVATED:
-        return VIXLevel.ELEVATED
-    else:
-        return VIXLevel.HIGH
+    return _VIX_LEVELS[bisect_right(_VIX_THRESHOLDS, vix_ratio)]
 
 
 def determine_posture(trend: Trend, vix_ratio: float) -> Posture:
@@ -252,16 +491,13 @@ def determine_posture(trend: Trend, vix_ratio: float) -> Posture:
     Returns:
         Posture enum value
     """
-    if trend == Trend.DOWNTREND:
-        return Posture.CASH
+    if trend is _DOWNTREND:
+        return _POSTURE_CASH
     
     # Uptrend - determine posture from VIX ratio
-    if vix_ratio < StrategyParams.VIX_LOW:
-        return Posture.AGGRESSIVE
-    elif vix_ratio > StrategyParams.VIX_ELEVATED:
-        return Posture.DEFENSIVE
-    else:
-        return Posture.BALANCED
+    if vix_ratio != vix_ratio:
+        return _POSTURE_NAN
+    return _UPTREND_POSTURES[bisect_right(_POSTURE_THRESHOLDS, vix_ratio)]
 
 
 def calculate_allocation(trend: Trend, vix_ratio: float) -> Allocation:
@@ -284,27 +520,18 @@ def calculate_allocation(trend: Trend, vix_ratio: float) -> Allocation:
         vix_ratio: VIX / VIX3M ratio
     
     Returns:
-        Allocation object with SPY, TQQQ, and Cash weights
+        Allocation object with SPY, TQQQ, and Cash weights (a shared,
+        immutable instance - do not expect a fresh object per call)
     """
     # Downtrend - 100% cash
-    if trend == Trend.DOWNTREND:
-        return Allocation(spy_weight=0.0, tqqq_weight=0.0, cash_weight=1.0)
+    if trend is _DOWNTREND:
+        return _ALLOC_CASH
     
     # Uptrend - allocate based on VIX ratio
-    if vix_ratio < StrategyParams.VIX_VERY_LOW:
-        return Allocation(spy_weight=0.30, tqqq_weight=0.70, cash_weight=0.0)
-    
-    elif vix_ratio < StrategyParams.VIX_LOW:
-        return Allocation(spy_weight=0.50, tqqq_weight=0.50, cash_weight=0.0)
-    
-    elif vix_ratio < StrategyParams.VIX_MODERATE:
-        return Allocation(spy_weight=0.60, tqqq_weight=0.40, cash_weight=0.0)
-    
-    elif vix_ratio < StrategyParams.VIX_ELEVATED:
-        return Allocation(spy_weight=0.75, tqqq_weight=0.25, cash_weight=0.0)
-    
-    else:
-        return Allocation(spy_weight=0.85, tqqq_weight=0.15, cash_weight=0.0)
+    return _UPTREND_ALLOCS[bisect_right(_VIX_THRESHOLDS, vix_ratio)]
+
+
+_NO_REBALANCE_RESULT = (False, "No rebalance required. Current allocation is optimal.")
 
 
 def generate_rebalance_instructions(
@@ -321,33 +548,38 @@ def generate_rebalance_instructions(
     Returns:
         Tuple of (rebalance_required: bool, instructions: str)
     """
+    # Both sides are the same shared instance in the steady state
+    if current_allocation is target_allocation:
+        return _NO_REBALANCE_RESULT
+    
     spy_change = target_allocation.spy_weight - current_allocation.spy_weight
     tqqq_change = target_allocation.tqqq_weight - current_allocation.tqqq_weight
     cash_change = target_allocation.cash_weight - current_allocation.cash_weight
+    spy_abs = abs(spy_change)
+    tqqq_abs = abs(tqqq_change)
+    cash_abs = abs(cash_change)
     
-    # Check if rebalance needed (threshold: 0.1%)
+    # Build instructions for each leg that moves by at least 0.1%
     threshold = 0.001
-    if (abs(spy_change) < threshold and 
-        abs(tqqq_change) < threshold and 
-        abs(cash_change) < threshold):
-        return False, "No rebalance required. Current allocation is optimal."
-    
-    # Build instructions
     instructions = []
     
-    if abs(spy_change) >= threshold:
+    if spy_abs >= threshold:
         action = "BUY" if spy_change > 0 else "SELL"
-        instructions.append(f"{action} {abs(spy_change)*100:.1f}% SPY")
+        instructions.append(_TRADE_FMT % (action, spy_abs*100, "SPY"))
     
-    if abs(tqqq_change) >= threshold:
+    if tqqq_abs >= threshold:
         action = "BUY" if tqqq_change > 0 else "SELL"
-        instructions.append(f"{action} {abs(tqqq_change)*100:.1f}% TQQQ")
+        instructions.append(_TRADE_FMT % (action, tqqq_abs*100, "TQQQ"))
     
-    if abs(cash_change) >= threshold:
+    if cash_abs >= threshold:
         if cash_change > 0:
-            instructions.append(f"Move {abs(cash_change)*100:.1f}% to Cash")
+            instructions.append(_MOVE_TO_CASH_FMT % (cash_abs*100))
         else:
-            instructions.append(f"Deploy {abs(cash_change)*100:.1f}% from Cash")
+            instructions.append(_DEPLOY_CASH_FMT % (cash_abs*100))
+    
+    # Every leg within threshold - no rebalance needed
+    if not instructions:
+        return _NO_REBALANCE_RESULT
     
     instruction_text = "Execute at next market open: " + " | ".join(instructions)
     
@@ -380,11 +612,35 @@ class TrendMonsterSignal:
         print(signal.trend)
         print(signal.allocation)
         print(signal.rebalance_instructions)
+        
+        # Or push signals to subscribers as new data arrives
+        generator.subscribe(lambda signal: print(signal.allocation))
+        await generator.run(market_data_updates)
     """
     
     def __init__(self):
         """Initialize signal generator."""
         self._current_allocation: Optional[Allocation] = None
+        self._subscribers: List[Callable[[Signal], None]] = []
+        self._last_signal: Optional[Signal] = None
+    
+    def subscribe(self, callback: Callable[[Signal], None]) -> None:
+        """
+        Register a callback for pushed signals (see run()).
+        
+        Args:
+            callback: Called with each new Signal; must not block
+        """
+        self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[Signal], None]) -> None:
+        """Remove a callback registered with subscribe()."""
+        self._subscribers.remove(callback)
+    
+    @property
+    def last_signal(self) -> Optional[Signal]:
+        """Most recent signal produced by run(), or None."""
+        return self._last_signal
     
     def set_current_allocation(
         self,
@@ -400,6 +656,13 @@ class TrendMonsterSignal:
             tqqq: Current TQQQ weight (0.0 to 1.0)
             cash: Current cash weight (0.0 to 1.0)
         """
+        # Reuse the shared instance when the portfolio is on a strategy bucket,
+        # so generate_rebalance_instructions() can short-circuit on identity
+        canonical = _CANONICAL_ALLOCS.get((spy, tqqq, cash))
+        if canonical is not None:
+            self._current_allocation = canonical
+            return
+        
         self._current_allocation = Allocation(
             spy_weight=spy,
             tqqq_weight=tqqq,
@@ -429,20 +692,40 @@ class TrendMonsterSignal:
         Returns:
             Signal object containing all strategy outputs
         """
-        # Calculate VIX ratio
-        vix_ratio = vix_close / vix3m_close
-        
-        # Determine trend (from weekly data)
-        trend = determine_trend(spy_weekly_close, spy_50week_sma)
-        
-        # Classify VIX level
-        vix_level = classify_vix_level(vix_ratio)
-        
-        # Determine posture
-        posture = determine_posture(trend, vix_ratio)
+        return self._generate(
+            spy_weekly_close,
+            spy_50week_sma,
+            float(vix_close) / float(vix3m_close),
+            weekly_as_of,
+            daily_as_of
+        )
+    
+    def _generate(
+        self,
+        spy_weekly_close: float,
+        spy_50week_sma: float,
+        vix_ratio: float,
+        weekly_as_of: Optional[datetime],
+        daily_as_of: Optional[datetime]
+    ) -> Signal:
+        """Build the signal, given the VIX ratio already computed by the caller."""
+        level_code = bisect_right(_VIX_THRESHOLDS, vix_ratio)
+        vix_level = _VIX_LEVELS[level_code]
         
-        # Calculate target allocation
-        target_allocation = calculate_allocation(trend, vix_ratio)
+        # Posture and target allocation (same shared instances as
+        # determine_posture / calculate_allocation). A downtrend is always
+        # 100% cash, so skip the posture lookup entirely.
+        if spy_weekly_close > spy_50week_sma:
+            trend = _UPTREND
+            if vix_ratio != vix_ratio:
+                posture = _POSTURE_NAN
+            else:
+                posture = _UPTREND_POSTURES[bisect_right(_POSTURE_THRESHOLDS, vix_ratio)]
+            target_allocation = _UPTREND_ALLOCS[level_code]
+        else:
+            trend = _DOWNTREND
+            posture = _POSTURE_CASH
+            target_allocation = _ALLOC_CASH
         
         # Generate rebalance instructions
         if self._current_allocation is not None:
@@ -482,13 +765,380 @@ class TrendMonsterSignal:
         Returns:
             Signal object
         """
-        return self.generate(
-            spy_weekly_close=data.spy_weekly_close,
-            spy_50week_sma=data.spy_50week_sma,
-            vix_close=data.vix_close,
-            vix3m_close=data.vix3m_close,
-            weekly_as_of=data.weekly_as_of,
-            daily_as_of=data.daily_as_of
+        return self._generate(
+            data.spy_weekly_close,
+            data.spy_50week_sma,
+            data.vix_ratio,
+            data.weekly_as_of,
+            data.daily_as_of
+        )
+    
+    async def generate_for_symbols(
+        self,
+        symbols: Iterable[str],
+        fetcher
+    ) -> List[Signal]:
+        """
+        Fetch market data for several symbols concurrently, then generate signals.
+        
+        Data fetches dominate wall-clock time, so they are overlapped with
+        asyncio.gather(); signal generation itself runs sequentially.
+        
+        Args:
+            symbols: Symbols (or strategy variants) to evaluate
+            fetcher: Object with an async fetch(symbol) method returning
+                MarketData (e.g. a wrapper around ib_insync or aiohttp)
+        
+        Returns:
+            List of Signal objects, in the same order as symbols
+        
+        Example:
+            signals = asyncio.run(generator.generate_for_symbols(["SPY"], fetcher))
+        """
+        datas = await asyncio.gather(*(fetcher.fetch(symbol) for symbol in symbols))
+        return [self.generate_from_data(data) for data in datas]
+    
+    async def run(self, updates: AsyncIterable[MarketData]) -> None:
+        """
+        Generate a signal for each data update and push it to subscribers.
+        
+        Replaces polling: signals are computed only when new data arrives
+        (e.g. a new daily VIX close), and subscribers are notified only when
+        a rebalance is required or trend, posture, VIX level or allocation
+        changed since the last signal.
+        
+        Args:
+            updates: Async iterable yielding MarketData as it is published
+        """
+        async for data in updates:
+            signal = self.generate_from_data(data)
+            last = self._last_signal
+            self._last_signal = signal
+            
+            if not (signal.rebalance_required or last is None
+                    or signal.trend is not last.trend
+                    or signal.posture is not last.posture
+                    or signal.vix_level is not last.vix_level
+                    or signal.allocation != last.allocation):
+                continue
+            
+            for callback in list(self._subscribers):
+                callback(signal)
+
+
+# ============================================================================
+# WEBSOCKET PUBLISHER
+# ============================================================================
+
+async def serve_websocket(
+    generator: TrendMonsterSignal,
+    updates: AsyncIterable[MarketData],
+    host: str = "localhost",
+    port: int = 8765
+) -> None:
+    """
+    Push signals to dashboard clients over a websocket.
+    
+    Runs generator.run(updates) and broadcasts each pushed signal as JSON
+    (Signal.to_json_bytes()) to every connected client. New clients
+    receive the latest signal on connect. Requires the websockets package.
+    
+    Args:
+        generator: Signal generator (current allocation already set)
+        updates: Async iterable yielding MarketData as it is published
+        host: Interface to listen on
+        port: Port to listen on
+    
+    Example:
+        asyncio.run(serve_websocket(TrendMonsterSignal(), vix_close_feed()))
+    """
+    import websockets
+    
+    clients = set()
+    
+    def broadcast(signal: Signal) -> None:
+        websockets.broadcast(clients, signal.to_json_bytes().decode())
+    
+    async def handler(websocket):
+        clients.add(websocket)
+        try:
+            if generator.last_signal is not None:
+                await websocket.send(generator.last_signal.to_json_bytes().decode())
+            await websocket.wait_closed()
+        finally:
+            clients.discard(websocket)
+    
+    generator.subscribe(broadcast)
+    try:
+        async with websockets.serve(handler, host, port):
+            await generator.run(updates)
+    finally:
+        generator.unsubscribe(broadcast)
+
+
+# ============================================================================
+# BATCH SIGNAL GENERATION
+# ============================================================================
+
+if np is not None:
+    # Weight columns of _UPTREND_ALLOCS, indexed by VIX level
+    _VIX_THRESHOLDS_ARR = np.array(_VIX_THRESHOLDS, dtype=np.float64)
+    _SPY_WTS = np.array([a.spy_weight for a in _UPTREND_ALLOCS], dtype=np.float64)
+    _TQQQ_WTS = np.array([a.tqqq_weight for a in _UPTREND_ALLOCS], dtype=np.float64)
+    _CASH_WTS = np.array([a.cash_weight for a in _UPTREND_ALLOCS], dtype=np.float64)
+
+
+# Loop range used by _signal_batch: rebound to numba.prange when the kernel
+# is JIT-compiled, plain range for the AOT build (compile_kernel.py)
+prange = range
+
+
+def _signal_batch(spy_close, spy_sma, vix, vix3m):
+    """
+    Per-bar signal over float arrays, for numba compilation.
+    
+    See _jit_signal_batch() and compile_kernel.py; generate_batch() never
+    runs it as plain Python.
+    """
+    n = spy_close.shape[0]
+    dtype = vix.dtype
+    uptrend = np.empty(n, dtype=np.bool_)
+    vix_ratio = np.empty(n, dtype=dtype)
+    level = np.empty(n, dtype=np.int64)
+    spy = np.empty(n, dtype=dtype)
+    tqqq = np.empty(n, dtype=dtype)
+    cash = np.empty(n, dtype=dtype)
+    for i in prange(n):
+        ratio = vix[i] / vix3m[i]
+        # Number of thresholds <= ratio, as with bisect_right() in
+        # classify_vix_level() (a NaN ratio passes all of them -> HIGH)
+        code = 0
+        for threshold in _VIX_THRESHOLDS:
+            if not ratio < threshold:
+                code += 1
+        up = spy_close[i] > spy_sma[i]
+        uptrend[i] = up
+        vix_ratio[i] = ratio
+        level[i] = code
+        if up:
+            spy[i] = _UPTREND_SPY_WTS[code]
+            tqqq[i] = _UPTREND_TQQQ_WTS[code]
+            cash[i] = _UPTREND_CASH_WTS[code]
+        else:
+            spy[i] = 0.0
+            tqqq[i] = 0.0
+            cash[i] = 1.0
+    return uptrend, vix_ratio, level, spy, tqqq, cash
+
+
+# numba dispatcher for _signal_batch: None until first use, False when numba
+# is not installed
+_signal_batch_jit = None
+
+
+def _jit_signal_batch():
+    """
+    JIT-compiled _signal_batch, or None when numba is not installed.
+    
+    numba is imported here rather than at module import, so only batch
+    callers pay for it.
+    """
+    global _signal_batch_jit, prange
+    if _signal_batch_jit is None:
+        try:
+            import numba
+        except ImportError:
+            _signal_batch_jit = False
+        else:
+            prange = numba.prange
+            # error_model="numpy": a zero VIX3M yields inf/nan (HIGH level)
+            # like the pure NumPy path, instead of an exception that prange
+            # cannot propagate
+            _signal_batch_jit = numba.njit(
+                parallel=True, cache=True, error_model="numpy"
+            )(_signal_batch)
+    return _signal_batch_jit or None
+
+
+def generate_batch(
+    spy_close,
+    spy_sma,
+    vix,
+    vix3m
+) -> Dict[str, "np.ndarray"]:
+    """
+    Vectorized signal generation for backtests over many bars.
+    
+    Applies the same trend filter and VIX ratio buckets as
+    TrendMonsterSignal.generate(), but over whole arrays using NumPy
+    instead of one Python call per bar. Float64 inputs use the _tm_kernel
+    build when present; otherwise the parallel numba kernel is used when
+    numba is installed.
+    
+    If every input is float32, the computation and outputs stay float32
+    (half the memory traffic). A ratio that falls within float32 rounding
+    of a threshold can then land in a different bucket than generate();
+    pass float64 for bar-exact agreement.
+    
+    Args:
+        spy_close: 1-D array of SPY weekly closes
+        spy_sma: 1-D array of 50-week SMAs (aligned with spy_close)
+        vix: 1-D array of VIX daily closes
+        vix3m: 1-D array of VIX3M daily closes
+    
+    Raises:
+        ValueError: If the inputs are not 1-D arrays of equal length
+    
+    Returns:
+        Dictionary of equal-length arrays:
+            "uptrend":   bool, True where spy_close > spy_sma
+            "vix_ratio": float32/float64 (as inputs), vix / vix3m
+            "vix_level": int, index into VIXLevel order (VERY_LOW..HIGH)
+            "spy", "tqqq", "cash": target weights (0.0 to 1.0), same dtype
+    
+    Example:
+        out = generate_batch(closes, smas, vix_closes, vix3m_closes)
+        equity_curve = (out["spy"] * spy_ret + out["tqqq"] * tqqq_ret).cumsum()
+    """
+    if np is None:
+        raise ImportError("generate_batch() requires numpy")
+    
+    # float32 only if every input already is; anything else computes in float64
+    columns = [np.asarray(a) for a in (spy_close, spy_sma, vix, vix3m)]
+    
+    # The kernels index every column by spy_close's length, so validate here
+    n = len(columns[0]) if columns[0].ndim == 1 else -1
+    for column in columns:
+        if column.ndim != 1 or len(column) != n:
+            raise ValueError(
+                f"Inputs must be 1-D arrays of equal length, got shapes "
+                f"{[c.shape for c in columns]}"
+            )
+    
+    dtype = np.result_type(*columns, np.float32)
+    if dtype != np.float32:
+        dtype = np.float64
+    spy_close, spy_sma, vix, vix3m = (np.asarray(a, dtype=dtype) for a in columns)
+    
+    # The AOT build needs no JIT warmup, so it wins whenever it applies
+    # (float64 only); the JIT kernel covers float32 and unbuilt installs
+    if _tm_kernel is not None and dtype == np.float64:
+        try:
+            return _batch_result(*_tm_kernel.signal_batch(spy_close, spy_sma, vix, vix3m))
+        except ZeroDivisionError:
+            # The AOT build cannot use numpy's error model; a zero VIX3M
+            # takes the NumPy path below (inf/nan ratio -> HIGH level)
+            pass
+    else:
+        signal_batch = _jit_signal_batch()
+        if signal_batch is not None:
+            return _batch_result(*signal_batch(spy_close, spy_sma, vix, vix3m))
+    
+    vix_ratio = vix / vix3m
+    uptrend = spy_close > spy_sma
+    
+    # side="right" matches bisect_right() in classify_vix_level(). The
+    # thresholds stay float64 so both paths compare identically.
+    level = np.searchsorted(_VIX_THRESHOLDS_ARR, vix_ratio, side="right")
+    
+    return _batch_result(
+        uptrend,
+        vix_ratio,
+        level,
+        np.where(uptrend, _SPY_WTS.astype(dtype)[level], 0.0),
+        np.where(uptrend, _TQQQ_WTS.astype(dtype)[level], 0.0),
+        np.where(uptrend, _CASH_WTS.astype(dtype)[level], 1.0)
+    )
+
+
+def _batch_result(uptrend, vix_ratio, level, spy, tqqq, cash) -> Dict[str, "np.ndarray"]:
+    """Package batch kernel outputs as the generate_batch() dictionary."""
+    return {
+        "uptrend": uptrend,
+        "vix_ratio": vix_ratio,
+        "vix_level": level,
+        "spy": spy,
+        "tqqq": tqqq,
+        "cash": cash,
+    }
+
+
+def _to_datetime64(dt: Optional[datetime]) -> "np.datetime64":
+    """datetime or date (or None) to datetime64[ns]; aware datetimes stored as UTC."""
+    if dt is None:
+        return np.datetime64("NaT", "ns")
+    if getattr(dt, "tzinfo", None) is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(dt, "ns")
+
+
+@dataclass(slots=True)
+class MarketDataFrame:
+    """
+    Column-oriented market data for batch backtests.
+    
+    One contiguous array per MarketData field instead of one object per bar,
+    ready to pass straight to generate_batch(). Missing as-of dates are NaT.
+    """
+    spy_weekly_close: "np.ndarray"   # float64 or float32
+    spy_50week_sma: "np.ndarray"     # float64 or float32
+    vix_close: "np.ndarray"          # float64 or float32
+    vix3m_close: "np.ndarray"        # float64 or float32
+    weekly_as_of: "np.ndarray"       # datetime64[ns]
+    daily_as_of: "np.ndarray"        # datetime64[ns]
+    
+    def __post_init__(self):
+        """Validate all columns have the same length."""
+        n = len(self.spy_weekly_close)
+        for column in (self.spy_50week_sma, self.vix_close, self.vix3m_close,
+                       self.weekly_as_of, self.daily_as_of):
+            if len(column) != n:
+                raise ValueError(f"All columns must have length {n}, got {len(column)}")
+    
+    def __len__(self) -> int:
+        return len(self.spy_weekly_close)
+    
+    @classmethod
+    def from_list(
+        cls,
+        items: List[MarketData],
+        dtype=None
+    ) -> "MarketDataFrame":
+        """
+        Build a frame from a list of MarketData bars.
+        
+        Args:
+            items: MarketData objects, oldest first
+            dtype: Price column dtype, np.float64 (default) or np.float32
+                to halve memory (see generate_batch() for the caveat)
+        
+        Returns:
+            MarketDataFrame with one row per item
+        """
+        if np is None:
+            raise ImportError("MarketDataFrame requires numpy")
+        
+        if dtype is None:
+            dtype = np.float64
+        n = len(items)
+        return cls(
+            spy_weekly_close=np.fromiter((d.spy_weekly_close for d in items), dtype, n),
+            spy_50week_sma=np.fromiter((d.spy_50week_sma for d in items), dtype, n),
+            vix_close=np.fromiter((d.vix_close for d in items), dtype, n),
+            vix3m_close=np.fromiter((d.vix3m_close for d in items), dtype, n),
+            weekly_as_of=np.array([_to_datetime64(d.weekly_as_of) for d in items],
+                                  dtype="datetime64[ns]"),
+            daily_as_of=np.array([_to_datetime64(d.daily_as_of) for d in items],
+                                 dtype="datetime64[ns]"),
+        )
+    
+    def generate_batch(self) -> Dict[str, "np.ndarray"]:
+        """Run generate_batch() over every row of the frame."""
+        return generate_batch(
+            self.spy_weekly_close,
+            self.spy_50week_sma,
+            self.vix_close,
+            self.vix3m_close
         )
 
 